@@ -1,27 +1,39 @@
 """Flask application factory"""
-from flask import Flask, render_template
+from flask import Flask, request
+from flask_compress import Compress
 from flask_cors import CORS
-from app.config import Config
+from app.config import CONFIG
 from app.logging_config import setup_logging
-from app.routes import api
-from app.metrics import metrics_endpoint
+from app.routes import api, db
+from app.metrics import metrics_endpoint, feedback_counter
 
 def create_app():
     """Create and configure Flask application"""
-    app = Flask(__name__,
-                static_folder='static',
-                template_folder='templates')
-    app.config.from_object(Config)
+    app = Flask(__name__, static_folder='static')
+    app.config.from_object(CONFIG)
 
     setup_logging()
     CORS(app)
 
+    # after_request hooks run in reverse order, so registering this before
+    # Compress makes it run after compression has suffixed the ETag
+    @app.after_request
+    def revalidate_compressed(response):
+        """Re-run conditional GET against the encoding-specific ETag"""
+        if 'Content-Encoding' in response.headers:
+            response.make_conditional(request)
+        return response
+
+    Compress(app)
+
+    feedback_counter.bind(db.count_feedback)
+
     app.register_blueprint(api)
     app.add_url_rule('/metrics', 'metrics', metrics_endpoint)
 
     @app.route('/')
     def index():
         """Serve frontend interface"""
-        return render_template('index.html')
+        return app.send_static_file('index.html')
 
     return app
@@ -1,13 +1,23 @@
 """Application configuration"""
 import os
+from dataclasses import dataclass
 
+
+@dataclass(frozen=True)
 class Config:
-    """Application configuration"""
-
-    DATABASE_PATH = os.getenv('DATABASE_PATH', 'data/feedback.db')
-    SECRET_KEY = os.getenv('SECRET_KEY', '07b13c38b89f521dd1c6227e3645abe1')
-    DEBUG = os.getenv('DEBUG', 'False') == 'True'
-    HOST = os.getenv('HOST', '0.0.0.0')
-    PORT = int(os.getenv('PORT', 8090))
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = os.getenv('LOG_FILE', 'logs/app.log')
+    """Application configuration, read from the environment once at import"""
+
+    DATABASE_PATH: str = os.getenv('DATABASE_PATH', 'data/feedback.db')
+    DB_POOL_SIZE: int = int(os.getenv('DB_POOL_SIZE', 5))
+    SECRET_KEY: str = os.getenv('SECRET_KEY', '07b13c38b89f521dd1c6227e3645abe1')
+    DEBUG: bool = os.getenv('DEBUG', 'False') == 'True'
+    HOST: str = os.getenv('HOST', '0.0.0.0')
+    PORT: int = int(os.getenv('PORT', 8090))
+    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FILE: str = os.getenv('LOG_FILE', 'logs/app.log')
+    COMPRESS_ALGORITHM: str = 'br,gzip'
+    COMPRESS_LEVEL: int = 5
+    COMPRESS_BR_LEVEL: int = 5
+
+
+CONFIG = Config()
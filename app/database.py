@@ -1,94 +1,182 @@
 """Database operations"""
+import atexit
+import os
+import queue
 import sqlite3
 import logging
 from typing import List, Optional
 from contextlib import contextmanager
 from app.models import Feedback
-from app.config import Config
+from app.config import CONFIG
 
 logger = logging.getLogger(__name__)
 
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA mmap_size=268435456',
+)
+
+STATEMENT_CACHE_SIZE = 256
+
+_FEEDBACK_COLUMNS = 'id, message, created_at, updated_at'
+
+_SQL_CREATE_TABLE = '''
+    CREATE TABLE IF NOT EXISTS feedback (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        message TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+'''
+_SQL_CREATE_INDEX = 'CREATE INDEX IF NOT EXISTS idx_feedback_created_at ON feedback (created_at DESC)'
+_SQL_INSERT = 'INSERT INTO feedback (message, created_at, updated_at) VALUES (?, ?, ?) RETURNING id'
+_SQL_SELECT_ALL = f'SELECT {_FEEDBACK_COLUMNS} FROM feedback ORDER BY created_at DESC'
+_SQL_SELECT_BY_ID = f'SELECT {_FEEDBACK_COLUMNS} FROM feedback WHERE id = ?'
+_SQL_UPDATE_RETURNING = (
+    f'UPDATE feedback SET message = ?, updated_at = ? WHERE id = ? RETURNING {_FEEDBACK_COLUMNS}'
+)
+_SQL_DELETE = 'DELETE FROM feedback WHERE id = ?'
+_SQL_COUNT = 'SELECT COUNT(*) AS count FROM feedback'
+
+class _ConnectionPool:
+    """Bounded pool of long-lived SQLite connections
+
+    Free slots hold None until first use, so connections are opened lazily.
+    Idle connections are closed before the process forks (e.g. gunicorn
+    --preload), because SQLite connections must not cross a fork.
+    """
+
+    def __init__(self, db_path: str, size: int):
+        self.db_path = db_path
+        self._size = size
+        self._connections = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._connections.put(None)
+        atexit.register(self.close)
+        os.register_at_fork(before=self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection shared across request threads"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        """Borrow a connection, blocking until one is free"""
+        conn = self._connections.get()
+        if conn is None:
+            try:
+                conn = self._connect()
+            except Exception:
+                self._connections.put(None)
+                raise
+        return conn
+
+    def put(self, conn: sqlite3.Connection):
+        """Return a borrowed connection to the pool"""
+        self._connections.put(conn)
+
+    def close(self):
+        """Close all idle pooled connections, leaving their slots free"""
+        for _ in range(self._size):
+            try:
+                conn = self._connections.get_nowait()
+            except queue.Empty:
+                break
+            if conn is not None:
+                conn.close()
+            self._connections.put(None)
+
+
 class DatabaseManager:
     """SQLite database manager"""
 
     def __init__(self, db_path: str = None):
-        self.db_path = db_path or Config.DATABASE_PATH
+        self.db_path = db_path or CONFIG.DATABASE_PATH
+        self._pool = None
         self._init_database()
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with automatic cleanup"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Borrow a pooled connection and return it when done"""
+        conn = self._pool.get()
         try:
             yield conn
             conn.commit()
         except Exception as e:
             conn.rollback()
-            logger.error(f"Database error: {e}")
+            logger.error("Database error: %s", e)
             raise
         finally:
-            conn.close()
+            self._pool.put(conn)
 
     def _init_database(self):
-        """Initialize database schema"""
+        """Initialize connection pool and database schema"""
+        self._pool = _ConnectionPool(self.db_path, CONFIG.DB_POOL_SIZE)
         with self._get_connection() as conn:
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS feedback (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    message TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            ''')
+            conn.execute(_SQL_CREATE_TABLE)
+            conn.execute(_SQL_CREATE_INDEX)
         logger.info("Database initialized")
 
     def create_feedback(self, feedback: Feedback) -> Feedback:
         """Create new feedback"""
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                'INSERT INTO feedback (message, created_at, updated_at) VALUES (?, ?, ?)',
+            rows = conn.execute(
+                _SQL_INSERT,
                 (feedback.message, feedback.created_at, feedback.updated_at)
-            )
-            feedback.id = cursor.lastrowid
-        logger.info(f"Created feedback: {feedback.id}")
+            ).fetchall()
+            feedback.id = rows[0][0]
+        logger.info("Created feedback: %s", feedback.id)
         return feedback
 
-    def get_all_feedback(self) -> List[Feedback]:
-        """Get all feedback"""
+    def get_all_feedback_dicts(self) -> List[dict]:
+        """Get all feedback as plain dictionaries, skipping model construction"""
         with self._get_connection() as conn:
-            rows = conn.execute('SELECT * FROM feedback ORDER BY created_at DESC').fetchall()
-            return [Feedback(**dict(row)) for row in rows]
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(_SQL_SELECT_ALL).fetchall()
+            return [
+                {'id': row[0], 'message': row[1], 'created_at': row[2], 'updated_at': row[3]}
+                for row in rows
+            ]
 
     def get_feedback_by_id(self, feedback_id: int) -> Optional[Feedback]:
         """Get feedback by ID"""
         with self._get_connection() as conn:
-            row = conn.execute('SELECT * FROM feedback WHERE id = ?', (feedback_id,)).fetchone()
+            row = conn.execute(_SQL_SELECT_BY_ID, (feedback_id,)).fetchone()
             return Feedback(**dict(row)) if row else None
 
-    def update_feedback(self, feedback_id: int, message: str, updated_at: str) -> bool:
-        """Update feedback"""
+    def update_and_return(self, feedback_id: int, message: str, updated_at: str) -> Optional[Feedback]:
+        """Update feedback and return the stored row, or None if it does not exist"""
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                'UPDATE feedback SET message = ?, updated_at = ? WHERE id = ?',
-                (message, updated_at, feedback_id)
-            )
-            success = cursor.rowcount > 0
-        if success:
-            logger.info(f"Updated feedback: {feedback_id}")
-        return success
+            # fetchall steps the statement to completion so the write is committed
+            rows = conn.execute(_SQL_UPDATE_RETURNING, (message, updated_at, feedback_id)).fetchall()
+        if not rows:
+            return None
+        logger.info("Updated feedback: %s", feedback_id)
+        return Feedback(**dict(rows[0]))
 
     def delete_feedback(self, feedback_id: int) -> bool:
         """Delete feedback"""
         with self._get_connection() as conn:
-            cursor = conn.execute('DELETE FROM feedback WHERE id = ?', (feedback_id,))
+            cursor = conn.execute(_SQL_DELETE, (feedback_id,))
             success = cursor.rowcount > 0
         if success:
-            logger.info(f"Deleted feedback: {feedback_id}")
+            logger.info("Deleted feedback: %s", feedback_id)
         return success
 
     def count_feedback(self) -> int:
         """Count total feedback"""
         with self._get_connection() as conn:
-            result = conn.execute('SELECT COUNT(*) as count FROM feedback').fetchone()
+            result = conn.execute(_SQL_COUNT).fetchone()
             return result['count'] if result else 0
@@ -1,34 +1,124 @@
 """Structured logging configuration"""
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pythonjsonlogger import jsonlogger
-from app.config import Config
+from app.config import CONFIG
+
+LOG_FILE_BUFFER_SIZE = 128 * 1024
+LOG_BATCH_CAPACITY = 1024
+
+_listener = None
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler that writes through a large buffer and flushes on demand"""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingHandler(logging.handlers.MemoryHandler):
+    """Memory handler that flushes its target once per batch"""
+
+    def flush(self):
+        super().flush()
+        with self.lock:
+            if self.target:
+                self.target.flush()
+
+
+def _pause_listener():
+    """Drain queued records and flush buffered handlers"""
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.flush()
+
+
+def _resume_listener():
+    """Restart the listener thread after a pause"""
+    if _listener is not None:
+        _listener.start()
+
+
+def _stop_listener():
+    """Drain and discard the active listener"""
+    global _listener
+    _pause_listener()
+    _listener = None
+
 
 def setup_logging():
-    """Configure structured JSON logging"""
+    """Configure structured JSON logging
+
+    Request threads only enqueue records; a background listener formats them
+    and writes to stdout and to the log file in batches.
+    """
+    global _listener
     log_format = '%(asctime)s %(levelname)s %(name)s %(message)s'
     json_formatter = jsonlogger.JsonFormatter(log_format)
 
+    _stop_listener()
+
     root_logger = logging.getLogger()
-    root_logger.setLevel(Config.LOG_LEVEL)
+    root_logger.setLevel(CONFIG.LOG_LEVEL)
     root_logger.handlers = []
 
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(Config.LOG_LEVEL)
+    console_handler.setLevel(CONFIG.LOG_LEVEL)
     console_handler.setFormatter(json_formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
+    file_error = None
     try:
-        file_handler = logging.FileHandler(Config.LOG_FILE)
-        file_handler.setLevel(Config.LOG_LEVEL)
+        file_handler = _BufferedFileHandler(CONFIG.LOG_FILE)
+        file_handler.setLevel(CONFIG.LOG_LEVEL)
         file_handler.setFormatter(json_formatter)
-        root_logger.addHandler(file_handler)
+        batching_handler = _BatchingHandler(
+            capacity=LOG_BATCH_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        batching_handler.setLevel(CONFIG.LOG_LEVEL)
+        handlers.append(batching_handler)
     except Exception as e:
-        root_logger.warning(f"Could not create file handler: {e}")
+        file_error = e
+
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    if file_error:
+        root_logger.warning("Could not create file handler: %s", file_error)
 
     root_logger.info("Logging configured", extra={
-        'log_level': Config.LOG_LEVEL,
-        'log_file': Config.LOG_FILE
+        'log_level': CONFIG.LOG_LEVEL,
+        'log_file': CONFIG.LOG_FILE
     })
 
     return root_logger
+
+
+atexit.register(_stop_listener)
+# Threads do not survive fork: flush before forking so buffered records are
+# not duplicated, then give parent and child their own listener thread.
+os.register_at_fork(
+    before=_pause_listener,
+    after_in_parent=_resume_listener,
+    after_in_child=_resume_listener
+)
@@ -1,9 +1,91 @@
 """Prometheus metrics instrumentation"""
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 from flask import Response
+from werkzeug.exceptions import HTTPException, NotFound
 from functools import wraps
+import logging
+import os
+import sqlite3
+import threading
 import time
 
+
+logger = logging.getLogger(__name__)
+
+FEEDBACK_COUNT_RECONCILE_SECONDS = 60
+
+
+class CachedCounter:
+    """Thread-safe in-process counter reconciled with its source in the background
+
+    Local writes adjust the value immediately and reads never touch the
+    source. Each worker process runs one daemon thread that reloads the value
+    every interval, so writes made by other workers are picked up.
+    """
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._value = 0
+        self._loader = None
+        self._reconciler_pid = None
+        self._lock = threading.Lock()
+
+    def bind(self, loader):
+        """Set the source of truth and load the initial value"""
+        self._loader = loader
+        self.refresh()
+
+    def refresh(self):
+        """Reload the value from the bound source
+
+        The lock is held for the whole reload so concurrent inc/dec calls
+        are applied after it rather than overwritten by it.
+        """
+        with self._lock:
+            self._value = self._loader()
+
+    @property
+    def value(self) -> int:
+        """Current value"""
+        self._ensure_reconciler()
+        return self._value
+
+    def inc(self, amount: int = 1):
+        """Increment counter"""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: int = 1):
+        """Decrement counter"""
+        with self._lock:
+            self._value -= amount
+
+    def _ensure_reconciler(self):
+        """Start the reconcile thread once per process
+
+        Started lazily rather than in bind so that it runs in gunicorn
+        workers and not in the preloading master, whose threads do not
+        survive fork.
+        """
+        pid = os.getpid()
+        if self._loader is None or self._reconciler_pid == pid:
+            return
+        with self._lock:
+            if self._reconciler_pid == pid:
+                return
+            self._reconciler_pid = pid
+        threading.Thread(target=self._reconcile, name='feedback-count-reconciler', daemon=True).start()
+
+    def _reconcile(self):
+        """Reload from the source every interval"""
+        while True:
+            time.sleep(self._interval)
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("Could not reconcile feedback count: %s", e)
+
+
 # Metric definitions
 http_requests_total = Counter(
     'http_requests_total',
@@ -11,6 +93,9 @@ http_requests_total = Counter(
     ['method', 'endpoint', 'status']
 )
 
+# Latency is deliberately labelled by method and endpoint only. Adding status
+# would multiply every bucket series by the number of response codes; derive
+# per-status views from http_requests_total with recording rules instead.
 http_request_duration_seconds = Histogram(
     'http_request_duration_seconds',
     'HTTP request duration',
@@ -28,6 +113,11 @@ feedback_count = Gauge(
     'Current feedback count'
 )
 
+# Bound to the database in create_app; creates/deletes adjust it between reconciles
+feedback_counter = CachedCounter(FEEDBACK_COUNT_RECONCILE_SECONDS)
+# Scrapes read the cached value only, so /metrics never queries the database
+feedback_count.set_function(lambda: feedback_counter.value)
+
 errors_total = Counter(
     'errors_total',
     'Total errors',
@@ -35,62 +125,103 @@ errors_total = Counter(
 )
 
 
-def track_request_metrics(endpoint_name):
+# Every (method, endpoint) the API serves, with the statuses its views return
+_ROUTE_STATUSES = (
+    ('GET', '/health', (200, 503)),
+    ('POST', '/feedback', (201, 400, 500)),
+    ('GET', '/feedback', (200, 500)),
+    ('GET', '/feedback/:id', (200, 304, 404, 500)),
+    ('PUT', '/feedback/:id', (200, 400, 404, 500)),
+    ('DELETE', '/feedback/:id', (200, 404, 500)),
+)
+
+# Labelled children bound once at import so the hot path skips labels()
+REQUEST_COUNTERS = {
+    (method, endpoint, status): http_requests_total.labels(method, endpoint, status)
+    for method, endpoint, statuses in _ROUTE_STATUSES
+    for status in statuses
+}
+
+REQUEST_HISTOGRAMS = {
+    (method, endpoint): http_request_duration_seconds.labels(method, endpoint)
+    for method, endpoint, _ in _ROUTE_STATUSES
+}
+
+OPERATION_COUNTERS = {
+    operation: feedback_operations_total.labels(operation)
+    for operation in ('create', 'read', 'update', 'delete')
+}
+
+ERROR_COUNTERS = {
+    error_type: errors_total.labels(error_type)
+    for error_type in ('validation', 'not_found', 'db', 'internal')
+}
+
+
+def _classify(exc: Exception) -> str:
+    """Map an exception onto the fixed set of error_type label values"""
+    if isinstance(exc, NotFound):
+        return 'not_found'
+    if isinstance(exc, HTTPException):
+        return 'validation' if exc.code is not None and exc.code < 500 else 'internal'
+    if isinstance(exc, (ValueError, KeyError)):
+        return 'validation'
+    if isinstance(exc, sqlite3.Error):
+        return 'db'
+    return 'internal'
+
+
+def _response_status(response) -> int:
+    """Extract HTTP status from a view return value"""
+    if isinstance(response, tuple):
+        return response[1]
+    return getattr(response, 'status_code', 200)
+
+
+def track_request_metrics(method: str, endpoint: str):
     """Decorator to track HTTP metrics"""
     def decorator(f):
+        duration_histogram = REQUEST_HISTOGRAMS[(method, endpoint)]
+
+        def count_status(status: int):
+            key = (method, endpoint, status)
+            counter = REQUEST_COUNTERS.get(key)
+            if counter is None:
+                counter = REQUEST_COUNTERS.setdefault(
+                    key, http_requests_total.labels(method, endpoint, status)
+                )
+            counter.inc()
+
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            start_time = time.time()
-            method = endpoint_name.split('_')[0].upper()
+            start_time = time.perf_counter()
 
             try:
                 response = f(*args, **kwargs)
-                duration = time.time() - start_time
-                status = response[1] if isinstance(response, tuple) else 200
-
-                http_requests_total.labels(
-                    method=method,
-                    endpoint=endpoint_name,
-                    status=status
-                ).inc()
-
-                http_request_duration_seconds.labels(
-                    method=method,
-                    endpoint=endpoint_name
-                ).observe(duration)
-
-                return response
-
             except Exception as e:
-                errors_total.labels(error_type=type(e).__name__).inc()
+                record_error(e)
+                count_status(e.code if isinstance(e, HTTPException) and e.code else 500)
+                duration_histogram.observe(time.perf_counter() - start_time)
                 raise
 
+            count_status(_response_status(response))
+            duration_histogram.observe(time.perf_counter() - start_time)
+            return response
+
         return decorated_function
     return decorator
 
 
 def record_feedback_operation(operation: str):
     """Record feedback operation"""
-    feedback_operations_total.labels(operation=operation).inc()
-
-
-def update_feedback_count(count: int):
-    """Update feedback count"""
-    feedback_count.set(count)
+    OPERATION_COUNTERS[operation].inc()
 
 
-def record_error(error_type: str):
-    """Record error"""
-    errors_total.labels(error_type=error_type).inc()
+def record_error(exc: Exception):
+    """Record error, bucketed by category"""
+    ERROR_COUNTERS[_classify(exc)].inc()
 
 
 def metrics_endpoint():
     """Expose Prometheus metrics"""
-    from app.database import DatabaseManager
-    db = DatabaseManager()
-    try:
-        count = db.count_feedback()
-        feedback_count.set(count)
-    except Exception:
-        pass
     return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
@@ -3,7 +3,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+_utcnow = datetime.utcnow
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string"""
+    return _utcnow().isoformat()
+
+
+@dataclass(slots=True)
 class Feedback:
     """Feedback model"""
     id: Optional[int]
@@ -14,7 +22,7 @@ class Feedback:
     @staticmethod
     def create(message: str) -> 'Feedback':
         """Create new feedback instance"""
-        now = datetime.utcnow().isoformat()
+        now = utc_timestamp()
         return Feedback(
             id=None,
             message=message,
@@ -1,16 +1,38 @@
 """API routes for feedback application"""
 import logging
-from datetime import datetime
-from flask import Blueprint, request, jsonify
+import orjson
+from flask import Blueprint, Response, request, jsonify
 from app.database import DatabaseManager
-from app.models import Feedback
-from app.metrics import record_feedback_operation, update_feedback_count
+from app.models import Feedback, utc_timestamp
+from app.metrics import record_feedback_operation, record_error, feedback_counter, track_request_metrics
 
 logger = logging.getLogger(__name__)
 
 api = Blueprint('api', __name__)
 db = DatabaseManager()
 
+FEEDBACK_CACHE_CONTROL = 'private, max-age=0, must-revalidate'
+
+
+def _json_response(obj, status: int = 200) -> Response:
+    """Serialize response body with orjson"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+
+def _etag_matches(etag: str) -> bool:
+    """Check If-None-Match, allowing the encoding suffix Flask-Compress appends"""
+    if_none_match = request.if_none_match
+    if if_none_match.contains_weak(etag):
+        return True
+    return any(tag.rpartition(':')[0] == etag for tag in if_none_match.as_set(include_weak=True))
+
+
+def _with_validators(response: Response, etag: str) -> Response:
+    """Attach a weak ETag and require revalidation on every use"""
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = FEEDBACK_CACHE_CONTROL
+    return response
+
 
 def validate_feedback_message(data: dict) -> tuple[bool, str]:
     """Validate feedback message from request"""
@@ -28,201 +50,125 @@ def validate_feedback_message(data: dict) -> tuple[bool, str]:
 
 
 @api.route('/health', methods=['GET'])
+@track_request_metrics('GET', '/health')
 def health_check():
     """Health check endpoint"""
-    from app.metrics import http_requests_total, http_request_duration_seconds
-    import time
-    start_time = time.time()
-
     try:
-        feedback_count = db.count_feedback()
+        feedback_count = feedback_counter.value
         logger.info("Health check performed")
 
-        duration = time.time() - start_time
-        http_requests_total.labels(method='GET', endpoint='/health', status=200).inc()
-        http_request_duration_seconds.labels(method='GET', endpoint='/health').observe(duration)
-
         return jsonify({
             'status': 'healthy',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': utc_timestamp(),
             'feedback_count': feedback_count
         }), 200
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        duration = time.time() - start_time
-        http_requests_total.labels(method='GET', endpoint='/health', status=503).inc()
-        http_request_duration_seconds.labels(method='GET', endpoint='/health').observe(duration)
-
+        record_error(e)
+        logger.error("Health check failed: %s", e)
         return jsonify({
             'status': 'unhealthy',
             'error': str(e)
         }), 503
 
 @api.route('/feedback', methods=['POST'])
+@track_request_metrics('POST', '/feedback')
 def create_feedback():
     """Create new feedback entry"""
-    from app.metrics import http_requests_total, http_request_duration_seconds
-    import time
-    start_time = time.time()
-
     try:
         is_valid, result = validate_feedback_message(request.json)
         if not is_valid:
-            duration = time.time() - start_time
-            http_requests_total.labels(method='POST', endpoint='/feedback', status=400).inc()
-            http_request_duration_seconds.labels(method='POST', endpoint='/feedback').observe(duration)
             return jsonify({'error': result}), 400
 
         feedback = Feedback.create(message=result)
         saved_feedback = db.create_feedback(feedback)
 
         record_feedback_operation('create')
-        update_feedback_count(db.count_feedback())
-
-        duration = time.time() - start_time
-        http_requests_total.labels(method='POST', endpoint='/feedback', status=201).inc()
-        http_request_duration_seconds.labels(method='POST', endpoint='/feedback').observe(duration)
+        feedback_counter.inc()
 
-        logger.info(f"Feedback created: {saved_feedback.id}")
+        logger.info("Feedback created: %s", saved_feedback.id)
         return jsonify(saved_feedback.to_dict()), 201
 
     except Exception as e:
-        logger.error(f"Error creating feedback: {e}")
-        duration = time.time() - start_time
-        http_requests_total.labels(method='POST', endpoint='/feedback', status=500).inc()
-        http_request_duration_seconds.labels(method='POST', endpoint='/feedback').observe(duration)
+        record_error(e)
+        logger.error("Error creating feedback: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @api.route('/feedback', methods=['GET'])
+@track_request_metrics('GET', '/feedback')
 def get_all_feedback():
     """Retrieve all feedback entries"""
-    from app.metrics import http_requests_total, http_request_duration_seconds
-    import time
-    start_time = time.time()
-
     try:
-        feedbacks = db.get_all_feedback()
+        feedbacks = db.get_all_feedback_dicts()
         record_feedback_operation('read')
 
-        duration = time.time() - start_time
-        http_requests_total.labels(method='GET', endpoint='/feedback', status=200).inc()
-        http_request_duration_seconds.labels(method='GET', endpoint='/feedback').observe(duration)
-
-        logger.info(f"Retrieved {len(feedbacks)} feedback entries")
-        return jsonify([f.to_dict() for f in feedbacks]), 200
+        logger.info("Retrieved %d feedback entries", len(feedbacks))
+        return _json_response(feedbacks)
 
     except Exception as e:
-        logger.error(f"Error retrieving feedback: {e}")
-        duration = time.time() - start_time
-        http_requests_total.labels(method='GET', endpoint='/feedback', status=500).inc()
-        http_request_duration_seconds.labels(method='GET', endpoint='/feedback').observe(duration)
+        record_error(e)
+        logger.error("Error retrieving feedback: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @api.route('/feedback/<int:feedback_id>', methods=['GET'])
+@track_request_metrics('GET', '/feedback/:id')
 def get_feedback(feedback_id):
     """Retrieve specific feedback by ID"""
-    from app.metrics import http_requests_total, http_request_duration_seconds
-    import time
-    start_time = time.time()
-
     try:
         feedback = db.get_feedback_by_id(feedback_id)
         if not feedback:
-            duration = time.time() - start_time
-            http_requests_total.labels(method='GET', endpoint='/feedback/:id', status=404).inc()
-            http_request_duration_seconds.labels(method='GET', endpoint='/feedback/:id').observe(duration)
             return jsonify({'error': 'Feedback not found'}), 404
 
-        duration = time.time() - start_time
-        http_requests_total.labels(method='GET', endpoint='/feedback/:id', status=200).inc()
-        http_request_duration_seconds.labels(method='GET', endpoint='/feedback/:id').observe(duration)
+        etag = feedback.updated_at
+        if _etag_matches(etag):
+            return _with_validators(Response(status=304), etag)
 
-        logger.info(f"Retrieved feedback: {feedback_id}")
-        return jsonify(feedback.to_dict()), 200
+        logger.info("Retrieved feedback: %s", feedback_id)
+        return _with_validators(_json_response(feedback.to_dict()), etag)
 
     except Exception as e:
-        logger.error(f"Error retrieving feedback {feedback_id}: {e}")
-        duration = time.time() - start_time
-        http_requests_total.labels(method='GET', endpoint='/feedback/:id', status=500).inc()
-        http_request_duration_seconds.labels(method='GET', endpoint='/feedback/:id').observe(duration)
+        record_error(e)
+        logger.error("Error retrieving feedback %s: %s", feedback_id, e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @api.route('/feedback/<int:feedback_id>', methods=['PUT'])
+@track_request_metrics('PUT', '/feedback/:id')
 def update_feedback(feedback_id):
     """Update existing feedback"""
-    from app.metrics import http_requests_total, http_request_duration_seconds
-    import time
-    start_time = time.time()
-
     try:
         is_valid, result = validate_feedback_message(request.json)
         if not is_valid:
-            duration = time.time() - start_time
-            http_requests_total.labels(method='PUT', endpoint='/feedback/:id', status=400).inc()
-            http_request_duration_seconds.labels(method='PUT', endpoint='/feedback/:id').observe(duration)
             return jsonify({'error': result}), 400
 
-        existing = db.get_feedback_by_id(feedback_id)
-        if not existing:
-            duration = time.time() - start_time
-            http_requests_total.labels(method='PUT', endpoint='/feedback/:id', status=404).inc()
-            http_request_duration_seconds.labels(method='PUT', endpoint='/feedback/:id').observe(duration)
+        updated_feedback = db.update_and_return(feedback_id, result, utc_timestamp())
+        if not updated_feedback:
             return jsonify({'error': 'Feedback not found'}), 404
 
-        updated_at = datetime.utcnow().isoformat()
-        success = db.update_feedback(feedback_id, result, updated_at)
-
-        if success:
-            updated_feedback = db.get_feedback_by_id(feedback_id)
-            record_feedback_operation('update')
-
-            duration = time.time() - start_time
-            http_requests_total.labels(method='PUT', endpoint='/feedback/:id', status=200).inc()
-            http_request_duration_seconds.labels(method='PUT', endpoint='/feedback/:id').observe(duration)
+        record_feedback_operation('update')
 
-            logger.info(f"Feedback updated: {feedback_id}")
-            return jsonify(updated_feedback.to_dict()), 200
-        else:
-            duration = time.time() - start_time
-            http_requests_total.labels(method='PUT', endpoint='/feedback/:id', status=500).inc()
-            http_request_duration_seconds.labels(method='PUT', endpoint='/feedback/:id').observe(duration)
-            return jsonify({'error': 'Update failed'}), 500
+        logger.info("Feedback updated: %s", feedback_id)
+        return jsonify(updated_feedback.to_dict()), 200
 
     except Exception as e:
-        logger.error(f"Error updating feedback {feedback_id}: {e}")
-        duration = time.time() - start_time
-        http_requests_total.labels(method='PUT', endpoint='/feedback/:id', status=500).inc()
-        http_request_duration_seconds.labels(method='PUT', endpoint='/feedback/:id').observe(duration)
+        record_error(e)
+        logger.error("Error updating feedback %s: %s", feedback_id, e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @api.route('/feedback/<int:feedback_id>', methods=['DELETE'])
+@track_request_metrics('DELETE', '/feedback/:id')
 def delete_feedback(feedback_id):
     """Delete feedback by ID"""
-    from app.metrics import http_requests_total, http_request_duration_seconds
-    import time
-    start_time = time.time()
-
     try:
         success = db.delete_feedback(feedback_id)
         if not success:
-            duration = time.time() - start_time
-            http_requests_total.labels(method='DELETE', endpoint='/feedback/:id', status=404).inc()
-            http_request_duration_seconds.labels(method='DELETE', endpoint='/feedback/:id').observe(duration)
             return jsonify({'error': 'Feedback not found'}), 404
 
         record_feedback_operation('delete')
-        update_feedback_count(db.count_feedback())
-
-        duration = time.time() - start_time
-        http_requests_total.labels(method='DELETE', endpoint='/feedback/:id', status=200).inc()
-        http_request_duration_seconds.labels(method='DELETE', endpoint='/feedback/:id').observe(duration)
+        feedback_counter.dec()
 
-        logger.info(f"Feedback deleted: {feedback_id}")
+        logger.info("Feedback deleted: %s", feedback_id)
         return jsonify({'message': 'Feedback deleted successfully'}), 200
 
     except Exception as e:
-        logger.error(f"Error deleting feedback {feedback_id}: {e}")
-        duration = time.time() - start_time
-        http_requests_total.labels(method='DELETE', endpoint='/feedback/:id', status=500).inc()
-        http_request_duration_seconds.labels(method='DELETE', endpoint='/feedback/:id').observe(duration)
+        record_error(e)
+        logger.error("Error deleting feedback %s: %s", feedback_id, e)
         return jsonify({'error': 'Internal server error'}), 500
@@ -0,0 +1,18 @@
+"""Gunicorn configuration"""
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8090')}"
+# Without a cpuset, nproc inside a container reports every host core, so cap
+# the default; each worker holds its own SQLite connection pool
+DEFAULT_MAX_WORKERS = 2
+
+workers = int(os.getenv('WEB_CONCURRENCY', min(len(os.sched_getaffinity(0)), DEFAULT_MAX_WORKERS)))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# Import the app once in the master and fork workers from it
+preload_app = True
+reuse_port = True
+
+accesslog = '-'
+errorlog = '-'
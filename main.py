@@ -1,16 +1,17 @@
 """Application entry point"""
 from dotenv import load_dotenv
-from app import create_app
-from app.config import Config
 
 load_dotenv()
 
+from app import create_app
+from app.config import CONFIG
+
 app = create_app()
 
 if __name__ == '__main__':
-    print(f"Starting app on {Config.HOST}:{Config.PORT} with debug={Config.DEBUG}")
+    print(f"Starting app on {CONFIG.HOST}:{CONFIG.PORT} with debug={CONFIG.DEBUG}")
     app.run(
-        host=Config.HOST,
-        port=Config.PORT,
-        debug=Config.DEBUG
+        host=CONFIG.HOST,
+        port=CONFIG.PORT,
+        debug=CONFIG.DEBUG
     )